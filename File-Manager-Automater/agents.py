@@ -10,10 +10,59 @@ This script implements an agent that:
 4. Compresses PDFs using ConvertAPI and images using TinyPNG.
 """
 
+import errno
+import logging
+import logging.handlers
+import mmap
 import os
+import queue
 import shutil
+import sys
+import tempfile
+import threading
+import urllib.parse
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
+
+# Number of log records buffered before they are written out in one batch.
+LOG_BUFFER_CAPACITY = 1024
+
+try:
+    import tinify
+except ImportError:
+    tinify = None
+
+TINYPNG_API_KEY = "xyz..."  # Provided TinyPNG key
+
+# Shared HTTP session so connections (and TLS handshakes) are reused across files.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Prefer the libyaml-backed loader; it parses several times faster than the pure-Python one.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# TinyPNG responds best with a handful of parallel uploads; cap in-flight calls.
+TINYPNG_MAX_CONCURRENCY = 5
+_tinypng_semaphore = threading.Semaphore(TINYPNG_MAX_CONCURRENCY)
+
+# Default number of compression requests allowed in flight at once.
+DEFAULT_COMPRESSION_WORKERS = 8
+
+# Maximum number of items waiting between two pipeline stages.
+PIPELINE_QUEUE_SIZE = 64
+
+# Seconds a stage waits on a full or empty queue between checks for cancellation.
+PIPELINE_POLL_INTERVAL = 0.1
+
+# Files smaller than this (in bytes) are not worth a compression round-trip by default.
+DEFAULT_MIN_COMPRESSION_SIZE = 50 * 1024
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 # ---------------------
 # Helper Functions
@@ -40,11 +89,12 @@ def format_size(size_bytes):
     """
     Convert a file size from bytes into a human-readable string format.
     
-    This function divides the byte size by 1024 iteratively and assigns
-    an appropriate unit (B, KB, MB, GB, or TB) until the size is less than 1024.
+    This function picks the unit (B, KB, MB, GB, or TB) from the bit length of the
+    byte count, since each unit is a factor of 2**10, and scales the size with a
+    single shift instead of repeatedly dividing by 1024.
     
     Args:
-        size_bytes (int): The file size in bytes.
+        size_bytes (int or float): The file size in bytes.
     
     Returns:
         str: A string representing the file size in a human-readable format.
@@ -53,10 +103,10 @@ def format_size(size_bytes):
         >>> readable = format_size(1234567)
         >>> print(readable)  # e.g., "1.18MB"
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f}{unit}"
-        size_bytes /= 1024
+    if size_bytes < 1:
+        return f"{size_bytes:.2f}B"
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (unit_index * 10)):.2f}{SIZE_UNITS[unit_index]}"
 
 
 def load_config(config_path):
@@ -64,8 +114,9 @@ def load_config(config_path):
     Load and parse a YAML configuration file.
     
     This function reads the YAML file from the given path and converts its contents
-    into a Python dictionary. In case of an error during reading or parsing,
-    it prints an error message and returns None.
+    into a Python dictionary, using the libyaml C loader when it is available.
+    In case of an error during reading or parsing, it logs an error message and
+    returns None.
     
     Args:
         config_path (str): The file path of the YAML configuration file.
@@ -79,45 +130,161 @@ def load_config(config_path):
         ...     print(config.get("input_folder_path"))
     """
     try:
+        if _YAML_LOADER is yaml.SafeLoader:
+            # Shown once per process by the default warnings filter
+            warnings.warn("libyaml is unavailable; falling back to the pure-Python YAML loader.")
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_YAML_LOADER)
     except Exception as e:
-        print(f"Error loading configuration from {config_path}: {e}")
+        log.error("Error loading configuration from %s: %s", config_path, e)
+        return None
+
+
+def get_int_setting(config, key, default, minimum):
+    """
+    Read an integer setting from a loaded configuration dictionary.
+    
+    The value is coerced with int() so that YAML strings such as "8" and floats are
+    accepted. Values that cannot be converted (e.g., "50KB"), booleans, and values
+    below minimum are rejected with a logged configuration error.
+    
+    Args:
+        config (dict): The loaded configuration.
+        key (str): The setting to read.
+        default (int): The value to use when the setting is absent.
+        minimum (int): The smallest allowed value.
+    
+    Returns:
+        int or None: The setting as an int if valid; otherwise, None.
+    
+    Example:
+        >>> get_int_setting({"compression_workers": "4"}, "compression_workers", 8, minimum=1)
+        4
+    """
+    raw = config.get(key, default)
+    try:
+        if isinstance(raw, bool):
+            raise TypeError("booleans are not allowed")
+        value = int(raw)
+    except (TypeError, ValueError):
+        log.error("Invalid configuration value for %s: %r is not an integer.", key, raw)
+        return None
+    if value < minimum:
+        log.error("Invalid configuration value for %s: %r is below the minimum of %d.", key, raw, minimum)
         return None
+    return value
+
+
+def configure_logging():
+    """
+    Route this module's log records through a buffered console handler.
+    
+    Records are collected by a MemoryHandler and written to stdout in batches, so
+    per-file status messages do not each cost a write call or contend on the stream
+    lock when compression runs on several threads. The buffer is flushed when it
+    fills up, when an error is logged, and when the handler is closed. Calling this
+    again returns the handler that is already attached instead of adding another.
+    
+    Returns:
+        logging.handlers.MemoryHandler: The buffering handler attached to the module logger.
+    
+    Example:
+        >>> handler = configure_logging()
+        >>> handler.flush()
+    """
+    for handler in log.handlers:
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            return handler
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=stream_handler
+    )
+    log.addHandler(memory_handler)
+    log.setLevel(logging.INFO)
+    return memory_handler
 
 # ---------------------
 # File Management Functions
 # ---------------------
 
-def scan_folder(folder_path):
+def scan_folder(folder_path, onerror=None):
     """
-    Recursively scan the specified folder and return a list of all file paths.
+    Recursively scan the specified folder and yield the path and size of every file found.
+    
+    This function walks the directory tree with os.scandir and an explicit stack,
+    using each entry's cached type information instead of an extra stat call.
+    The size comes from DirEntry.stat(), which is cached on the entry (and free
+    on Windows), so callers do not need to stat the file again. Each directory is
+    read in full before its files are yielded, so callers may move them away while
+    the scan continues; across directories results are still produced lazily.
     
-    This function traverses the directory tree starting at the given folder path,
-    collecting the full paths of every file found.
+    Like os.walk, symlinks to directories are not followed or yielded, and a
+    directory or entry that cannot be read is skipped: the error is logged and,
+    if onerror is given, passed to it.
     
     Args:
         folder_path (str): The path to the folder to be scanned.
+        onerror (callable, optional): Called with the OSError for each skipped directory or entry.
     
-    Returns:
-        list: A list of strings, each representing a full file path.
+    Yields:
+        tuple: The full path of each file and its size in bytes.
     
     Example:
-        >>> files = scan_folder("data/input_folder")
-        >>> print(files)
+        >>> for path, size in scan_folder("data/input_folder"):
+        ...     print(path, size)
     """
-    files = []
-    for root, dirs, filenames in os.walk(folder_path):
-        for filename in filenames:
-            files.append(os.path.join(root, filename))
-    return files
+    def skip(error):
+        log.error("Skipping %s during scan: %s", error.filename, error)
+        if onerror is not None:
+            onerror(error)
+
+    stack = [folder_path]
+    while stack:
+        try:
+            # Read the whole directory before yielding anything: movers rename entries out
+            # of it while the scan runs, and readdir results are undefined under modification
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError as e:
+            skip(e)
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        stack.append(entry.path)
+                    continue
+                size_bytes = entry.stat().st_size
+            except OSError as e:
+                skip(e)
+                continue
+            yield entry.path, size_bytes
+
+
+# Every category get_file_category can return; each gets a subfolder in the output folder.
+FILE_CATEGORIES = ('PDFs', 'Images', 'Code', 'Others')
+
+# Lower-case file extension -> category. Anything not listed here is "Others".
+EXTENSION_CATEGORIES = {
+    '.pdf': 'PDFs',
+    '.png': 'Images',
+    '.jpg': 'Images',
+    '.jpeg': 'Images',
+    '.py': 'Code',
+    '.js': 'Code',
+    '.java': 'Code',
+    '.c': 'Code',
+    '.cpp': 'Code',
+}
 
 
 def get_file_category(file_path):
     """
     Determine the category of a file based on its extension.
     
-    This function inspects the file's extension (case-insensitive) and classifies it into one of the following:
+    This function looks up the file's extension (case-insensitive) in EXTENSION_CATEGORIES
+    and classifies it into one of the following:
       - "PDFs" for files ending with '.pdf'
       - "Images" for files ending with '.png', '.jpg', or '.jpeg'
       - "Code" for files ending with '.py', '.js', '.java', '.c', or '.cpp'
@@ -133,43 +300,95 @@ def get_file_category(file_path):
         >>> category = get_file_category("data/input_folder/document.pdf")
         >>> print(category)  # Outputs: PDFs
     """
-    ext = os.path.splitext(file_path)[1].lower()
-    if ext == '.pdf':
-        return 'PDFs'
-    elif ext in ['.png', '.jpg', '.jpeg']:
-        return 'Images'
-    elif ext in ['.py', '.js', '.java', '.c', '.cpp']:
-        return 'Code'
-    else:
-        return 'Others'
+    return EXTENSION_CATEGORIES.get(os.path.splitext(file_path)[1].lower(), 'Others')
+
+
+def fast_move(src, dst):
+    """
+    Move a file, renaming it in place when possible and copying it in the kernel otherwise.
+    
+    On the same filesystem the move is a single os.replace, which also overwrites an
+    existing dst on Windows. When the destination is on
+    another device, the data is copied with os.copy_file_range so it never passes
+    through a user-space buffer, then the source is removed. Platforms without
+    copy_file_range (or filesystems that reject it) fall back to shutil.copyfileobj.
+    The copy is written to a temporary file next to dst and renamed into place with
+    os.replace, so concurrent moves of files with the same name never interleave.
+    
+    Args:
+        src (str): The full path of the file to move.
+        dst (str): The full destination path, including the file name.
+    
+    Returns:
+        None
+    
+    Example:
+        >>> fast_move("data/input_folder/example.pdf", "data/output_folder/PDFs/example.pdf")
+    """
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(dst) or '.', prefix=f".{os.path.basename(dst)}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, 'wb') as fdst, open(src, 'rb') as fsrc:
+            try:
+                if not hasattr(os, "copy_file_range"):
+                    raise OSError(errno.ENOSYS, "copy_file_range is not available")
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            except OSError:
+                # Start over with a regular buffered copy
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst)
+        shutil.copystat(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    os.remove(src)
 
 
 def move_file_to_category(file_path, base_output_folder):
     """
     Move a file to a categorized subfolder within the output folder.
     
-    This function first determines the file's category using get_file_category,
-    creates a subfolder within the output folder if it doesn't already exist,
-    and then moves the file to that subfolder. It returns the new file path.
+    This function first determines the file's category using get_file_category
+    and then moves the file to the matching subfolder, which must already exist
+    (main() creates all of them up front). It returns the new file path together
+    with the category so callers do not need to classify the file again.
     
     Args:
         file_path (str): The full path to the file to be moved.
         base_output_folder (str): The root folder where files should be organized.
     
     Returns:
-        str: The new path of the file after it has been moved.
+        tuple: The new path of the file after it has been moved and its category.
     
     Example:
-        >>> new_path = move_file_to_category("data/input_folder/example.pdf", "data/output_folder")
-        >>> print(new_path)
+        >>> new_path, category = move_file_to_category("data/input_folder/example.pdf", "data/output_folder")
+        >>> print(new_path, category)
     """
     category = get_file_category(file_path)
     destination_folder = os.path.join(base_output_folder, category)
-    os.makedirs(destination_folder, exist_ok=True)  # Create destination folder if it doesn't exist
     new_file_path = os.path.join(destination_folder, os.path.basename(file_path))
-    shutil.move(file_path, new_file_path)
-    print(f"Moved {file_path} to {new_file_path}")
-    return new_file_path
+    fast_move(file_path, new_file_path)
+    log.info("Moved %s to %s", file_path, new_file_path)
+    return new_file_path, category
 
 # ---------------------
 # Compression Functions
@@ -179,10 +398,11 @@ def compress_pdf(file_path, method):
     """
     Compress a PDF file using the specified method.
     
-    This function supports compression via ConvertAPI. It sends an HTTP POST request
-    to the ConvertAPI endpoint along with the PDF file and required parameters.
-    If the response status is 200, it prints a success message and returns True;
-    otherwise, it prints an error message and returns False.
+    This function supports compression via ConvertAPI. It sends an HTTP POST request over the
+    shared session to the ConvertAPI endpoint with the memory-mapped PDF as the raw request body.
+    If the response status is 200, it logs a success message and returns True;
+    otherwise, including when the file cannot be read or the request fails, it
+    logs an error message and returns False.
     
     Args:
         file_path (str): The full path to the PDF file to be compressed.
@@ -199,17 +419,41 @@ def compress_pdf(file_path, method):
         convertapi_url = "paste url here"
         convertapi_secret = "xyz..."  # Provided ConvertAPI secret key
         params = {"Secret": convertapi_secret, "StoreFile": "true"}
-        with open(file_path, 'rb') as f:
-            files = {"File": f}
-            response = requests.post(convertapi_url, params=params, files=files)
+        filename = os.path.basename(file_path)
+        # Header values must be Latin-1, so send an escaped ASCII fallback plus the
+        # full UTF-8 name in RFC 6266 filename* form
+        ascii_filename = "".join(
+            "\\" + c if c in '"\\' else c if " " <= c < "\x7f" else "_" for c in filename
+        )
+        headers = {
+            "Content-Type": "application/pdf",
+            "Content-Disposition": (
+                f'inline; filename="{ascii_filename}"; '
+                f"filename*=UTF-8''{urllib.parse.quote(filename, safe='')}"
+            ),
+        }
+        try:
+            with open(file_path, 'rb') as f:
+                # Send the file as a raw body backed by a read-only memory map, so the kernel
+                # pages it in on demand; mmap cannot map an empty file, so send an empty body for those
+                is_mapped = os.fstat(f.fileno()).st_size > 0
+                body = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if is_mapped else b""
+                try:
+                    response = _SESSION.post(convertapi_url, params=params, data=body, headers=headers)
+                finally:
+                    if is_mapped:
+                        body.close()
+        except (OSError, requests.RequestException, UnicodeEncodeError) as e:
+            log.error("PDF compression failed for %s: %s", file_path, e)
+            return False
         if response.status_code == 200:
-            print(f"PDF compression successful for {file_path}")
+            log.info("PDF compression successful for %s", file_path)
             return True
         else:
-            print(f"PDF compression failed for {file_path}. Status: {response.status_code}")
+            log.error("PDF compression failed for %s. Status: %s", file_path, response.status_code)
             return False
     else:
-        print("Unsupported PDF compression method.")
+        log.warning("Unsupported PDF compression method.")
         return False
 
 
@@ -218,7 +462,7 @@ def compress_image(file_path, method):
     Compress an image file (PNG or JPG) using the specified method.
     
     This function uses the TinyPNG API via the tinify package to compress image files.
-    If tinify is not installed, it prints an error message. Upon successful compression,
+    If tinify is not installed, it logs an error message. Upon successful compression,
     the function returns True; otherwise, it returns False.
     
     Args:
@@ -233,52 +477,184 @@ def compress_image(file_path, method):
         >>> print(success)
     """
     if method.lower() == "tinypng":
-        try:
-            import tinify
-        except ImportError:
-            print("tinify package not installed. Please install it via pip.")
+        if tinify is None:
+            log.error("tinify package not installed. Please install it via pip.")
             return False
-        tinify.key = "xyz..."  # Provided TinyPNG key
         try:
-            source = tinify.from_file(file_path)
-            source.to_file(file_path)
-            print(f"Image compression successful for {file_path}")
+            with _tinypng_semaphore:
+                source = tinify.from_file(file_path)
+                source.to_file(file_path)
+            log.info("Image compression successful for %s", file_path)
             return True
         except Exception as e:
-            print(f"Image compression failed for {file_path}: {e}")
+            log.error("Image compression failed for %s: %s", file_path, e)
             return False
     else:
-        print("Unsupported image compression method.")
+        log.warning("Unsupported image compression method.")
         return False
 
 
-def select_compression_function(category):
+# Compression dispatch table: file extension -> (compression function, key in the
+# "compression_method" section of file_manager_config.yml). Extensions not listed
+# here are not compressed.
+COMPRESSORS = {
+    '.pdf': (compress_pdf, 'PDF'),
+    '.png': (compress_image, 'PNG'),
+    '.jpg': (compress_image, 'JPG'),
+    '.jpeg': (compress_image, 'JPG'),
+}
+
+# Categories that can contain files listed in COMPRESSORS; everything else is only moved.
+COMPRESSIBLE_CATEGORIES = frozenset(EXTENSION_CATEGORIES[ext] for ext in COMPRESSORS)
+
+# ---------------------
+# Pipeline Stages
+# ---------------------
+
+def resolve_compression_job(new_file_path, category, size_bytes, compression_methods, min_compression_size):
     """
-    Select and return the appropriate compression function based on file category.
+    Decide whether a moved file should be compressed, and how.
     
-    This function checks the file category and returns the corresponding compression
-    function. For "PDFs", it returns compress_pdf; for "Images", it returns compress_image.
-    If the category does not support compression, it returns None.
+    The file's extension is looked up in COMPRESSORS and the matching method in the
+    flattened compression_method configuration. Only files whose category is in
+    COMPRESSIBLE_CATEGORIES (and so whose extension is in COMPRESSORS) may be passed.
+    Files without a configured method or smaller than min_compression_size are not
+    compressed.
     
     Args:
-        category (str): The category of the file (e.g., "PDFs", "Images", "Code", "Others").
+        new_file_path (str): The path of the file in the output folder.
+        category (str): The category returned by move_file_to_category.
+        size_bytes (int): The size of the file in bytes.
+        compression_methods (dict): Mapping of file type (e.g., "PDF") to compression method.
+        min_compression_size (int): The smallest size, in bytes, worth compressing.
     
     Returns:
-        function or None: The selected compression function if available; otherwise, None.
+        tuple or None: (new_file_path, category, compression_func, compress_method) if the
+        file should be compressed; otherwise, None.
     
     Example:
-        >>> func = select_compression_function("Images")
-        >>> print(func)  # Outputs the compress_image function
-    """
-    if category == "PDFs":
-        print("Decision: Category is 'PDFs'. Selected function: compress_pdf")
-        return compress_pdf
-    elif category == "Images":
-        print("Decision: Category is 'Images'. Selected function: compress_image")
-        return compress_image
-    else:
-        print(f"Decision: Category '{category}' does not have a compression function.")
+        >>> job = resolve_compression_job("data/output_folder/PDFs/a.pdf", "PDFs", 80000, {"PDF": "convertapi"}, 51200)
+    """
+    if size_bytes < min_compression_size:
+        log.info("Skipping compression of %s: below %s", new_file_path, format_size(min_compression_size))
         return None
+    compression_func, file_type = COMPRESSORS[os.path.splitext(new_file_path)[1].lower()]
+    compress_method = compression_methods.get(file_type)
+    if compress_method is None:
+        return None
+    log.info("Decision: Category is '%s'. Selected function: %s", category, compression_func.__name__)
+    return new_file_path, category, compression_func, compress_method
+
+
+def put_unless_cancelled(target_queue, item, cancel):
+    """
+    Put an item on a bounded queue, giving up if the pipeline is cancelled.
+    
+    A plain put() on a full queue blocks forever once its consumers are gone, so
+    this waits in short slices and checks the cancel event in between.
+    
+    Args:
+        target_queue (queue.Queue): The queue to put the item on.
+        item: The item to queue.
+        cancel (threading.Event): Set when the pipeline is shutting down.
+    
+    Returns:
+        bool: True if the item was queued, False if the pipeline was cancelled first.
+    """
+    while not cancel.is_set():
+        try:
+            target_queue.put(item, timeout=PIPELINE_POLL_INTERVAL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def scan_stage(input_folder, move_queue, mover_count, failed, cancel):
+    """
+    Pipeline stage that feeds scanned files to the movers.
+    
+    Every (path, size) pair produced by scan_folder is put on move_queue. Entries
+    that cannot be read are logged and skipped, and an error that stops the scan
+    is logged; either way the failed event is set so main() can report an
+    incomplete run. The same happens if the pipeline is cancelled before every
+    file was queued. When the scan ends, one None sentinel per mover thread is
+    queued so each mover knows to stop.
+    
+    Args:
+        input_folder (str): The folder to scan.
+        move_queue (queue.Queue): Queue consumed by move_stage.
+        mover_count (int): The number of move_stage threads reading from move_queue.
+        failed (threading.Event): Set when any file could not be scanned.
+        cancel (threading.Event): Set by main() when the pipeline is shutting down.
+    
+    Returns:
+        None
+    """
+    try:
+        for file_path, size_bytes in scan_folder(input_folder, onerror=lambda e: failed.set()):
+            # Log the original file size in a readable format
+            log.info("Original size of %s: %s", file_path, format_size(size_bytes))
+            if not put_unless_cancelled(move_queue, (file_path, size_bytes), cancel):
+                log.error("Scanning %s was cancelled before every file was processed.", input_folder)
+                failed.set()
+                return
+    except Exception as e:
+        log.error("Scanning %s stopped early: %s", input_folder, e)
+        failed.set()
+    finally:
+        for _ in range(mover_count):
+            put_unless_cancelled(move_queue, None, cancel)
+
+
+def move_stage(move_queue, compress_queue, output_folder, compression_methods, min_compression_size, failed, cancel):
+    """
+    Pipeline stage that moves files and forwards compression jobs.
+    
+    Files are taken from move_queue until a None sentinel arrives and moved into their
+    category subfolder. Files outside COMPRESSIBLE_CATEGORIES stop there; PDFs and
+    Images are passed on to compress_queue when resolve_compression_job selects a
+    compressor. A None sentinel is always put on compress_queue when the stage
+    finishes. Any error while handling a file is logged, the failed event is set,
+    and the stage moves on to the next file.
+    
+    Args:
+        move_queue (queue.Queue): Queue of (file_path, size_bytes) items from scan_stage.
+        compress_queue (queue.Queue): Queue of compression jobs consumed by main().
+        output_folder (str): The root folder where files should be organized.
+        compression_methods (dict): Mapping of file type (e.g., "PDF") to compression method.
+        min_compression_size (int): The smallest size, in bytes, worth compressing.
+        failed (threading.Event): Set when any file could not be moved.
+        cancel (threading.Event): Set by main() when the pipeline is shutting down.
+    
+    Returns:
+        None
+    """
+    try:
+        while not cancel.is_set():
+            try:
+                item = move_queue.get(timeout=PIPELINE_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if item is None:
+                break
+            file_path, size_bytes = item
+            try:
+                new_file_path, category = move_file_to_category(file_path, output_folder)
+                # Fast path: Code and Others files never have a compressor
+                if category not in COMPRESSIBLE_CATEGORIES:
+                    continue
+                job = resolve_compression_job(
+                    new_file_path, category, size_bytes, compression_methods, min_compression_size
+                )
+            except Exception as e:
+                log.error("Failed to move %s: %s", file_path, e)
+                failed.set()
+                continue
+            if job is not None:
+                put_unless_cancelled(compress_queue, job, cancel)
+    finally:
+        put_unless_cancelled(compress_queue, None, cancel)
 
 # ---------------------
 # Main Agent Workflow
@@ -290,76 +666,127 @@ def main():
     
     The workflow consists of:
       1. Loading configuration files for folder paths and compression methods.
-      2. Scanning the input folder to collect all file paths.
+      2. Scanning the input folder for files.
       3. Moving each file to a categorized subfolder in the output directory.
-      4. Compressing files (PDFs and Images) using the configured compression methods.
-      5. Printing detailed status messages for each operation.
+      4. Compressing files (PDFs and Images) concurrently using the configured compression methods.
+      5. Logging detailed status messages for each operation through a buffered handler.
+    
+    Steps 2-4 run as a pipeline: a scanner thread feeds mover threads through a bounded
+    queue, and the movers feed compression jobs to a thread pool through a second one.
+    The number of compression jobs submitted but not yet finished is capped as well,
+    so a slow compression stage holds back the movers.
     
     Returns:
-        None
+        bool: True if every file was scanned and moved; False if configuration loading
+        failed or any file was skipped.
     
     Example:
         >>> python3 agents.py
     """
+    # Buffered records are flushed by logging.shutdown() when the interpreter exits
+    configure_logging()
+
     # Load configuration files for input/output paths and compression methods
     agent_config = load_config("agentic_config.yml")
     file_manager_config = load_config("file_manager_config.yml")
     if not agent_config or not file_manager_config:
-        print("Configuration files are missing or invalid. Exiting.")
-        return
+        log.error("Configuration files are missing or invalid. Exiting.")
+        return False
+
+    # Flatten the list of {file_type: method} entries into a single lookup table
+    compression_methods = {
+        file_type: method
+        for item in file_manager_config.get("compression_method", [])
+        for file_type, method in item.items()
+    }
+
+    # Configure the TinyPNG client once rather than on every image
+    if tinify is not None:
+        tinify.key = TINYPNG_API_KEY
 
     # Retrieve input and output folder paths from the configuration
     input_folder = agent_config.get("input_folder_path", "data/input_folder")
     output_folder = agent_config.get("output_folder_path", "data/output_folder")
 
-    # Scan the input folder for all files
-    files = scan_folder(input_folder)
-    for file_path in files:
-        # Determine and print the original file size in a readable format
-        original_size = format_size(get_file_size(file_path))
-        print(f"Original size of {file_path}: {original_size}")
-
-        # Move the file to the corresponding category subfolder in the output folder
-        new_file_path = move_file_to_category(file_path, output_folder)
-        moved_size = format_size(get_file_size(new_file_path))
-        print(f"Size after moving to output folder: {moved_size}")
-
-        # Determine the file category and select the appropriate compression function
-        category = get_file_category(new_file_path)
-        compression_func = select_compression_function(category)
-        if compression_func is not None:
-            # Determine the compression method from configuration for PDFs and Images
-            if category == "PDFs":
-                compress_method = next(
-                    (item.get("PDF") for item in file_manager_config.get("compression_method", []) if "PDF" in item),
-                    None
-                )
-            elif category == "Images":
-                ext = os.path.splitext(new_file_path)[1].lower()
-                if ext in ['.jpg', '.jpeg']:
-                    compress_method = next(
-                        (item.get("JPG") for item in file_manager_config.get("compression_method", []) if "JPG" in item),
-                        None
-                    )
-                elif ext == '.png':
-                    compress_method = next(
-                        (item.get("PNG") for item in file_manager_config.get("compression_method", []) if "PNG" in item),
-                        None
-                    )
-                else:
-                    compress_method = None
-            else:
-                compress_method = None
-
-            # If a valid compression method is found, compress the file and print the new size
-            if compress_method is not None and compression_func(new_file_path, compress_method):
-                compressed_size = format_size(get_file_size(new_file_path))
-                print(f"Size after {category[:-1]} compression: {compressed_size}")
-
-        # Print a blank line for better readability between file processes
-        print()
-
-    print("All files processed. Agent work completed.")
+    max_workers = get_int_setting(file_manager_config, "compression_workers", DEFAULT_COMPRESSION_WORKERS, minimum=1)
+    if max_workers is None:
+        return False
+
+    min_compression_size = get_int_setting(
+        file_manager_config, "min_compression_size", DEFAULT_MIN_COMPRESSION_SIZE, minimum=0
+    )
+    if min_compression_size is None:
+        return False
+
+    # Create every category subfolder once instead of once per file
+    for category in FILE_CATEGORIES:
+        os.makedirs(os.path.join(output_folder, category), exist_ok=True)
+
+    # Run scanning, moving and compression as concurrent stages connected by bounded queues,
+    # so uploads start while the scan and moves are still in progress. The executor is
+    # created before any stage starts so a failure here cannot strand running threads.
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    move_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    compress_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    mover_count = os.cpu_count() or 1
+    failed = threading.Event()
+    cancel = threading.Event()
+    # Daemon threads, so an unexpected error in main() cannot keep the interpreter alive
+    stages = [
+        threading.Thread(
+            target=scan_stage, args=(input_folder, move_queue, mover_count, failed, cancel), daemon=True
+        )
+    ]
+    stages += [
+        threading.Thread(
+            target=move_stage,
+            args=(move_queue, compress_queue, output_folder, compression_methods, min_compression_size, failed, cancel),
+            daemon=True,
+        )
+        for _ in range(mover_count)
+    ]
+
+    # Jobs submitted to the executor but not finished yet; once the limit is reached the
+    # dispatcher stops draining compress_queue, which in turn blocks the movers
+    in_flight = threading.BoundedSemaphore(max_workers + PIPELINE_QUEUE_SIZE)
+    try:
+        for stage in stages:
+            stage.start()
+
+        with executor:
+            futures = {}
+            finished_movers = 0
+            while finished_movers < mover_count:
+                job = compress_queue.get()
+                if job is None:
+                    finished_movers += 1
+                    continue
+                new_file_path, category, compression_func, compress_method = job
+                in_flight.acquire()
+                future = executor.submit(compression_func, new_file_path, compress_method)
+                future.add_done_callback(lambda _: in_flight.release())
+                futures[future] = (new_file_path, category)
+
+            # Every mover has exited; if they stopped early, release a scanner stuck on a full queue
+            cancel.set()
+            for stage in stages:
+                stage.join()
+
+            for future in as_completed(futures):
+                new_file_path, category = futures[future]
+                # If the compression succeeded, log the new size
+                if future.result():
+                    compressed_size = format_size(get_file_size(new_file_path))
+                    log.info("Size after %s compression of %s: %s", category[:-1], new_file_path, compressed_size)
+    finally:
+        cancel.set()
+
+    if failed.is_set():
+        log.error("Some files could not be scanned or moved; see the errors above.")
+        return False
+
+    log.info("All files processed. Agent work completed.")
+    return True
 
 if __name__ == "__main__":
-    main()
+    sys.exit(0 if main() else 1)